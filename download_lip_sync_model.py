@@ -4,8 +4,8 @@ Download dlib shape predictor model for lip sync.
 """
 
 import os
-import urllib.request
 import bz2
+import requests
 from pathlib import Path
 
 def download_and_extract():
@@ -15,8 +15,7 @@ def download_and_extract():
     models_dir = Path("models")
     models_dir.mkdir(exist_ok=True)
     
-    # File paths
-    compressed_file = models_dir / "shape_predictor_68_face_landmarks.dat.bz2"
+    # File path
     extracted_file = models_dir / "shape_predictor_68_face_landmarks.dat"
     
     # Check if already exists
@@ -31,19 +30,19 @@ def download_and_extract():
     print(f"URL: {url}")
     
     try:
-        # Download the file
-        urllib.request.urlretrieve(url, compressed_file)
+        # Download and decompress in a single pass, so the .bz2 archive
+        # never hits disk and the decompressed model never sits in memory
+        decompressor = bz2.BZ2Decompressor()
+        with requests.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            with open(extracted_file, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    if chunk:
+                        data = decompressor.decompress(chunk)
+                        if data:
+                            f.write(data)
         print("Download complete!")
-        
-        # Extract the file
-        print("Extracting...")
-        with bz2.BZ2File(compressed_file, 'rb') as f_in:
-            with open(extracted_file, 'wb') as f_out:
-                f_out.write(f_in.read())
-        
-        # Remove compressed file
-        compressed_file.unlink()
-        
+
         print("✅ Lip sync model installed successfully!")
         print(f"Location: {extracted_file.absolute()}")
         
@@ -51,6 +50,9 @@ def download_and_extract():
         
     except Exception as e:
         print(f"❌ Error downloading lip sync model: {e}")
+        # Remove any partial file so the next run retries the download
+        if extracted_file.exists():
+            extracted_file.unlink()
         print("\nYou can manually download from:")
         print(f"1. Download: {url}")
         print(f"2. Extract and place at: {extracted_file.absolute()}")
@@ -4,19 +4,31 @@ Download the face swap model from alternative sources.
 """
 
 import os
-import urllib.request
 import hashlib
+import requests
 from pathlib import Path
 
 def download_with_progress(url, destination):
     """Download file with progress bar."""
-    def download_hook(block_num, block_size, total_size):
-        downloaded = block_num * block_size
-        percent = min(100, (downloaded / total_size) * 100)
-        print(f"Downloading: {percent:.1f}% ({downloaded}/{total_size} bytes)", end='\r')
-    
+    CHUNK_SIZE = 1024 * 1024  # 1 MiB chunks for high sustained throughput
+    PROGRESS_EVERY = 16
+
     print(f"Downloading from: {url}")
-    urllib.request.urlretrieve(url, destination, reporthook=download_hook)
+    with requests.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        total_size = int(response.headers.get('content-length', 0))
+
+        with open(destination, "wb") as f:
+            downloaded = 0
+            chunk_count = 0
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if chunk:
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    chunk_count += 1
+                    if total_size > 0 and chunk_count % PROGRESS_EVERY == 0:
+                        percent = (downloaded / total_size) * 100
+                        print(f"Downloading: {percent:.1f}% ({downloaded}/{total_size} bytes)", end='\r')
     print("\nDownload complete!")
 
 def main():
@@ -5,7 +5,6 @@ Camera processing module for real-time face swapping.
 import cv2
 import numpy as np
 import threading
-import queue
 import time
 from typing import Optional, Callable
 
@@ -39,9 +38,12 @@ class CameraProcessor:
         self.capture_thread = None
         self.process_thread = None
         
-        # Frame queues
-        self.input_queue = queue.Queue(maxsize=2)
-        self.output_queue = queue.Queue(maxsize=2)
+        # Frame slots - single latest-value slots instead of queues.
+        # Swapping a reference is atomic under the GIL, so the hot path
+        # needs no locks; the event just wakes the process thread
+        self._input_frame = None
+        self._input_ready = threading.Event()
+        self._output_frame = None
         
         # Callbacks
         self.frame_callback = None
@@ -54,7 +56,22 @@ class CameraProcessor:
         # Performance settings
         self.skip_frames = 2  # Process every Nth frame
         self.frame_counter = 0
+        # Counts frames that actually reach the swapper; detection
+        # decimation is measured in these, not in camera frames, so the
+        # detect interval means the same thing in every skip mode
+        self.processed_counter = 0
         self.resolution_scale = 0.5  # Scale down for processing
+
+        # Reusable resize buffers, allocated on first frame and reused
+        # every cycle so the hot path stops churning the allocator
+        self._small_buf = None
+        self._big_buf = None
+
+        # Alternating RGB output buffers for the frame callback, so the
+        # consumer can still be reading the previous frame while the
+        # next one is converted
+        self._rgb_bufs = [None, None]
+        self._rgb_buf_idx = 0
         
         # Lip sync
         if LIP_SYNC_AVAILABLE:
@@ -66,6 +83,10 @@ class CameraProcessor:
         
         # Store original frame for lip sync
         self.original_frame = None
+
+        # Per-frame processing function, specialized for the current
+        # configuration (see _build_tick)
+        self._tick = self._build_tick()
         
     def set_source_image(self, image_path: str) -> bool:
         """
@@ -80,9 +101,24 @@ class CameraProcessor:
         if self.face_swapper:
             return self.face_swapper.set_source_face(image_path)
         return False
-    
+
+    def set_source_image_ndarray(self, image) -> bool:
+        """
+        Set source image for face swapping from a decoded BGR array.
+
+        Args:
+            image: BGR image containing the source face
+
+        Returns:
+            True if successful
+        """
+        if self.face_swapper:
+            return self.face_swapper.set_source_face_ndarray(image)
+        return False
+
     def set_frame_callback(self, callback: Callable):
-        """Set callback for processed frames."""
+        """Set callback for processed frames. Frames are delivered in
+        RGB order, ready for display."""
         self.frame_callback = callback
     
     def start(self) -> bool:
@@ -101,8 +137,13 @@ class CameraProcessor:
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
         self.cap.set(cv2.CAP_PROP_FPS, 30)
         
-        # macOS specific optimizations
-        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # macOS specific optimizations: a 1-frame driver buffer keeps
+        # preview latency down; not every backend honours it, so warn
+        # when it is ignored (the grab() draining in _capture_loop then
+        # has to make up for the extra buffered frames)
+        if not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print("Warning: camera backend ignored CAP_PROP_BUFFERSIZE=1, "
+                  "preview latency may be higher")
         
         self.is_running = True
         
@@ -128,68 +169,123 @@ class CameraProcessor:
             self.cap.release()
             self.cap = None
         
-        # Clear queues
-        while not self.input_queue.empty():
-            self.input_queue.get()
-        while not self.output_queue.empty():
-            self.output_queue.get()
+        # Clear frame slots
+        self._input_frame = None
+        self._input_ready.clear()
+        self._output_frame = None
     
     def _capture_loop(self):
         """Capture frames from camera."""
+        # Time the camera stream was last advanced by any grab or read -
+        # staleness is measured from here, not from the last delivery,
+        # since the skip branch below also consumes buffered frames
+        last_grab = time.monotonic()
+
         while self.is_running:
             if self.cap and self.cap.isOpened():
-                ret, frame = self.cap.read()
+                # While the processor is still busy, advance the camera
+                # stream with grab() only - it skips the frame decode that
+                # read() would do, so dropped frames cost almost nothing
+                if self._input_ready.is_set():
+                    self.cap.grab()
+                    last_grab = time.monotonic()
+                    continue
+
+                # Some AVFoundation backends ignore CAP_PROP_BUFFERSIZE=1
+                # and still queue a few frames internally. Only when the
+                # stream has sat idle for a couple of frame intervals can
+                # stale frames have queued up - drain those with grab() so
+                # retrieve() decodes the newest one. On a freshly advanced
+                # stream each grab() would block a full frame interval
+                # waiting for a new frame, so the drain must stay off the
+                # steady-state path
+                if time.monotonic() - last_grab >= 2.0 / 30.0:
+                    for _ in range(3):
+                        self.cap.grab()
+                    ret, frame = self.cap.retrieve()
+                else:
+                    ret, frame = self.cap.read()
+                last_grab = time.monotonic()
+
                 if ret:
-                    # Drop old frames
-                    if self.input_queue.full():
-                        try:
-                            self.input_queue.get_nowait()
-                        except:
-                            pass
-                    
-                    try:
-                        self.input_queue.put_nowait(frame)
-                    except:
-                        pass
+                    self._input_frame = frame
+                    self._input_ready.set()
             else:
                 time.sleep(0.01)
     
+    def _build_tick(self):
+        """
+        Build the per-frame processing function for the current
+        configuration.
+
+        The face-swapper / lip-sync / scale decisions are resolved once
+        here instead of being re-checked on every frame, so the inner loop
+        runs a single specialized closure.
+        """
+        face_swapper = self.face_swapper
+        lip_sync = self.lip_sync if (self.enable_lip_sync and self.lip_sync
+                                     and self.lip_sync.enabled) else None
+        scale = self.resolution_scale
+        # Nearest is ~3x cheaper than linear for the upscale-back, so use
+        # it in fast mode
+        upscale = cv2.INTER_NEAREST if self.skip_frames > 2 else cv2.INTER_LINEAR
+
+        if face_swapper is None:
+            def tick(frame, frame_idx):
+                return frame
+            return tick
+
+        def tick(frame, frame_idx):
+            height, width = frame.shape[:2]
+            small_w = int(width * scale)
+            small_h = int(height * scale)
+
+            # (Re)allocate the reusable buffers if the frame size changed
+            if self._small_buf is None or self._small_buf.shape[:2] != (small_h, small_w):
+                self._small_buf = np.empty((small_h, small_w, 3), dtype=np.uint8)
+                self._big_buf = np.empty((height, width, 3), dtype=np.uint8)
+
+            # INTER_AREA averages source pixels in one pass, which is
+            # both faster and better-looking for a >2x shrink
+            small_frame = cv2.resize(frame, (small_w, small_h), dst=self._small_buf,
+                                     interpolation=cv2.INTER_AREA)
+
+            processed_small = face_swapper.process_frame(small_frame, frame_idx=frame_idx)
+            processed_frame = cv2.resize(processed_small, (width, height),
+                                         dst=self._big_buf, interpolation=upscale)
+
+            # Apply lip sync, converting the camera frame to gray once
+            # here so lip sync doesn't redo it
+            if lip_sync is not None:
+                source_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                processed_frame = lip_sync.process_frame(
+                    frame, processed_frame, source_gray=source_gray
+                )
+            return processed_frame
+
+        return tick
+
     def _process_loop(self):
         """Process frames for face swapping."""
         last_processed_frame = None
-        
+
         while self.is_running:
+            if not self._input_ready.wait(timeout=0.1):
+                continue
+            frame = self._input_frame
+            self._input_ready.clear()
+
             try:
-                frame = self.input_queue.get(timeout=0.1)
-                self.original_frame = frame.copy()  # Store for lip sync
-                
+                # Store for lip sync; the frame is never mutated on the
+                # swap path so a reference is enough, no copy needed
+                self.original_frame = frame
+
                 # Frame skipping for performance
                 self.frame_counter += 1
-                
+
                 if self.frame_counter % self.skip_frames == 0:
-                    # Resize frame for processing
-                    height, width = frame.shape[:2]
-                    small_frame = cv2.resize(
-                        frame, 
-                        (int(width * self.resolution_scale), 
-                         int(height * self.resolution_scale))
-                    )
-                    
-                    # Process frame
-                    if self.face_swapper:
-                        processed_small = self.face_swapper.process_frame(small_frame)
-                        # Resize back to original
-                        processed_frame = cv2.resize(processed_small, (width, height))
-                        
-                        # Apply lip sync if enabled
-                        if self.enable_lip_sync and self.lip_sync and self.lip_sync.enabled:
-                            processed_frame = self.lip_sync.process_frame(
-                                self.original_frame, 
-                                processed_frame
-                            )
-                    else:
-                        processed_frame = frame
-                    
+                    self.processed_counter += 1
+                    processed_frame = self._tick(frame, self.processed_counter)
                     last_processed_frame = processed_frame
                 else:
                     # Use last processed frame
@@ -226,33 +322,29 @@ class CameraProcessor:
                     2
                 )
                 
-                # Send to callback
+                # Send to callback in RGB: converting here, while the
+                # frame is still hot in cache, saves the preview thread a
+                # second full pass over the pixels
                 if self.frame_callback:
-                    self.frame_callback(processed_frame)
+                    buf = self._rgb_bufs[self._rgb_buf_idx]
+                    if buf is None or buf.shape != processed_frame.shape:
+                        buf = np.empty_like(processed_frame)
+                        self._rgb_bufs[self._rgb_buf_idx] = buf
+                    self._rgb_buf_idx ^= 1
+                    rgb_frame = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB, dst=buf)
+                    self.frame_callback(rgb_frame)
                 
-                # Store in output queue
-                if self.output_queue.full():
-                    try:
-                        self.output_queue.get_nowait()
-                    except:
-                        pass
-                
-                try:
-                    self.output_queue.put_nowait(processed_frame)
-                except:
-                    pass
-                    
-            except queue.Empty:
-                continue
+                # Store in output slot, replacing any unread frame
+                self._output_frame = processed_frame
+
             except Exception as e:
                 print(f"Error in process loop: {e}")
-    
+
     def get_frame(self) -> Optional[np.ndarray]:
         """Get latest processed frame."""
-        try:
-            return self.output_queue.get_nowait()
-        except queue.Empty:
-            return None
+        frame = self._output_frame
+        self._output_frame = None
+        return frame
     
     def get_fps(self) -> float:
         """Get current FPS."""
@@ -268,16 +360,32 @@ class CameraProcessor:
         if mode == 'fast':
             self.skip_frames = 3
             self.resolution_scale = 0.4
+            detect_interval = 3
         elif mode == 'balanced':
             self.skip_frames = 2
             self.resolution_scale = 0.5
+            detect_interval = 2
         else:  # quality
             self.skip_frames = 1
             self.resolution_scale = 0.8
+            detect_interval = 2
+
+        # Decimate detection calls rather than output frames: the swap
+        # itself is cheap next to detection, so every frame still gets a
+        # fresh swap from the cached face boxes
+        if self.face_swapper:
+            self.face_swapper.set_detect_interval(detect_interval)
+
+        # Invalidate resize buffers so they are reallocated at the new
+        # scale, and respecialize the frame handler for the new settings
+        self._small_buf = None
+        self._big_buf = None
+        self._tick = self._build_tick()
     
     def toggle_lip_sync(self):
         """Toggle lip sync on/off."""
         if LIP_SYNC_AVAILABLE and self.lip_sync:
             self.enable_lip_sync = not self.enable_lip_sync
+            self._tick = self._build_tick()
             return self.enable_lip_sync
         return False 
\ No newline at end of file
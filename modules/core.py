@@ -35,10 +35,23 @@ class FaceSwapper:
         
         # Source face embedding
         self.source_face = None
+
+        # Detection decimation: face detection dominates per-frame cost,
+        # so re-detect only every Nth frame and reuse the cached faces in
+        # between - the face barely moves between consecutive frames
+        self.detect_interval = 1
+        self._cached_faces = None
+        self._last_detect_idx = None
         
-    def _get_providers(self) -> List[str]:
+    def _get_providers(self) -> List:
         """Get ONNX Runtime providers based on execution provider."""
         if self.execution_provider == 'coreml':
+            # No provider options: the CoreML EP in the pinned
+            # onnxruntime-silicon 1.13 takes none (an options dict is
+            # silently dropped), while ORT releases new enough to parse
+            # CoreML options reject unknown keys at session creation.
+            # Revisit MLProgram/compute-unit options once the ORT pin is
+            # raised to a release that documents them
             return ['CoreMLExecutionProvider', 'CPUExecutionProvider']
         else:
             return ['CPUExecutionProvider']
@@ -86,47 +99,99 @@ class FaceSwapper:
             except Exception as e:
                 print(f"Error loading from model zoo: {e}")
     
+    def warm_up(self):
+        """
+        Trigger provider graph compilation before the first real frame.
+
+        The CoreML provider JIT-compiles each model on its first run,
+        which otherwise costs a few seconds on the first camera frame
+        while the preview is already live. Run the detector on a
+        synthetic frame and push zeroed inputs through the swapper
+        session so both graphs are compiled up front; results are
+        discarded.
+        """
+        try:
+            # Compiles the detection/recognition models
+            self.face_app.get(np.zeros((640, 640, 3), dtype=np.uint8))
+
+            # Compiles the swapper model - only the compilation matters,
+            # so zeroed inputs are fine
+            session = getattr(self.face_swapper, 'session', None)
+            if session is not None:
+                feeds = {}
+                for model_input in session.get_inputs():
+                    shape = [dim if isinstance(dim, int) else 1 for dim in model_input.shape]
+                    feeds[model_input.name] = np.zeros(shape, dtype=np.float32)
+                session.run(None, feeds)
+        except Exception as e:
+            print(f"Warm-up inference failed (non-fatal): {e}")
+
     def set_source_face(self, image_path: str) -> bool:
         """
         Set source face from image.
-        
+
         Args:
             image_path: Path to source face image
-            
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Read image
+        img = cv2.imread(image_path)
+        if img is None:
+            print(f"Error: Cannot read image from {image_path}")
+            return False
+
+        return self.set_source_face_ndarray(img)
+
+    def set_source_face_ndarray(self, img: np.ndarray) -> bool:
+        """
+        Set source face from an already-decoded BGR image.
+
+        Args:
+            img: BGR image containing the source face
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Read image
-            img = cv2.imread(image_path)
-            if img is None:
-                print(f"Error: Cannot read image from {image_path}")
-                return False
-            
             # Detect faces
             faces = self.face_app.get(img)
             if not faces:
                 print("Error: No face detected in source image")
                 return False
-            
+
             # Use first detected face
             self.source_face = faces[0]
-            print(f"Source face loaded successfully from {image_path}")
+            print("Source face loaded successfully")
             print(f"Face bbox: {self.source_face.bbox}")
             print(f"Face confidence: {self.source_face.det_score}")
             return True
-            
+
         except Exception as e:
             print(f"Error setting source face: {e}")
             return False
     
-    def process_frame(self, frame: np.ndarray) -> np.ndarray:
+    def set_detect_interval(self, interval: int):
+        """
+        Set how many frames a detection result is reused for.
+
+        Args:
+            interval: Re-detect every Nth frame (1 = every frame)
+        """
+        self.detect_interval = max(1, interval)
+        self._cached_faces = None
+        self._last_detect_idx = None
+
+    def process_frame(self, frame: np.ndarray, frame_idx: Optional[int] = None) -> np.ndarray:
         """
         Process a single frame for face swapping.
-        
+
         Args:
             frame: Input frame
-            
+            frame_idx: Optional monotonically increasing frame counter,
+                used to decide when to re-run face detection
+
         Returns:
             Processed frame
         """
@@ -148,14 +213,26 @@ class FaceSwapper:
             return frame
         
         try:
-            # Detect faces in target frame
-            target_faces = self.face_app.get(frame)
-            
+            # Detect faces in target frame, reusing the cached detection
+            # when the caller provides a frame counter and we are inside
+            # the re-detect interval
+            if (frame_idx is not None
+                    and self._cached_faces is not None
+                    and self._last_detect_idx is not None
+                    and frame_idx - self._last_detect_idx < self.detect_interval):
+                target_faces = self._cached_faces
+            else:
+                target_faces = self.face_app.get(frame)
+                self._cached_faces = target_faces
+                self._last_detect_idx = frame_idx
+
             if not target_faces:
                 return frame
             
-            # Process each detected face
-            result = frame.copy()
+            # Process each detected face. No upfront copy needed:
+            # swapper.get with paste_back=True always allocates a new
+            # image, so the input frame is never written to
+            result = frame
             for target_face in target_faces:
                 # Swap face
                 result = self.face_swapper.get(
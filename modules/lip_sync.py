@@ -25,35 +25,74 @@ class LipSyncProcessor:
         
         # Mouth landmark indices (points 48-67 in dlib's 68-point model)
         self.mouth_points = list(range(48, 68))
-        
-    def get_mouth_landmarks(self, image: np.ndarray) -> Optional[np.ndarray]:
+
+        # Poisson blending is by far the most expensive step, so only run
+        # it every Nth frame; the cheap masked blend covers the rest
+        self._seamless_every = 4
+        self._frame_idx = 0
+
+        # Reusable landmark buffers - one per role so source and target
+        # landmarks for the same frame never alias each other
+        self._source_mouth_buf = np.empty((len(self.mouth_points), 2), dtype=np.float32)
+        self._target_mouth_buf = np.empty((len(self.mouth_points), 2), dtype=np.float32)
+
+        # Cache of the most recent gray conversion, keyed by the identity
+        # of the BGR frame, so repeat calls within one tick are free. The
+        # source array is kept referenced so its id() cannot be recycled
+        # by a new allocation while the cache entry is alive
+        self._last_gray_src = None
+        self._last_gray = None
+
+    def _to_gray(self, image: np.ndarray) -> np.ndarray:
+        """Convert a BGR image to gray, reusing the last conversion if it
+        was for this very same array."""
+        if image is self._last_gray_src and self._last_gray is not None:
+            return self._last_gray
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        self._last_gray = gray
+        self._last_gray_src = image
+        return gray
+
+    def get_mouth_landmarks(self, image: np.ndarray,
+                            out: Optional[np.ndarray] = None,
+                            gray: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         Extract mouth landmarks from image.
-        
+
         Args:
             image: Input image
-            
+            out: Optional preallocated (20, 2) float32 array to fill.
+                The buffer is reused, so copy it if you keep it around.
+            gray: Optional grayscale version of image, if the caller
+                already converted it
+
         Returns:
             Array of mouth landmark points or None
         """
         if not self.enabled:
             return None
-            
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+        if gray is None:
+            gray = self._to_gray(image)
         faces = self.detector(gray)
-        
+
         if len(faces) == 0:
             return None
-        
+
         # Get landmarks for first face
         shape = self.predictor(gray, faces[0])
-        
-        # Extract mouth points
-        mouth_points = []
-        for i in self.mouth_points:
-            mouth_points.append([shape.part(i).x, shape.part(i).y])
-        
-        return np.array(mouth_points, dtype=np.float32)
+
+        return self._extract_mouth_points(shape, out)
+
+    def _extract_mouth_points(self, shape, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Copy the mouth points of a dlib shape into a float32 array."""
+        if out is None:
+            out = np.empty((len(self.mouth_points), 2), dtype=np.float32)
+        for j, i in enumerate(self.mouth_points):
+            point = shape.part(i)
+            out[j, 0] = point.x
+            out[j, 1] = point.y
+        return out
     
     def transfer_mouth(self, source_frame: np.ndarray, target_frame: np.ndarray, 
                       source_mouth: np.ndarray, target_mouth: np.ndarray) -> np.ndarray:
@@ -71,11 +110,7 @@ class LipSyncProcessor:
         """
         if source_mouth is None or target_mouth is None:
             return target_frame
-        
-        # Create mouth mask
-        mask = np.zeros(target_frame.shape[:2], dtype=np.uint8)
-        cv2.fillPoly(mask, [target_mouth.astype(np.int32)], 255)
-        
+
         # Get bounding boxes
         sx, sy, sw, sh = cv2.boundingRect(source_mouth.astype(np.int32))
         tx, ty, tw, th = cv2.boundingRect(target_mouth.astype(np.int32))
@@ -93,6 +128,11 @@ class LipSyncProcessor:
         th = min(target_frame.shape[0] - ty, th + 2 * padding)
         
         try:
+            # Create mouth mask at ROI size only - a full-frame buffer
+            # would be ~30x the pixels just to hold this small polygon
+            mouth_mask = np.zeros((th, tw), dtype=np.uint8)
+            cv2.fillPoly(mouth_mask, [(target_mouth - (tx, ty)).astype(np.int32)], 255)
+
             # Extract mouth regions
             source_mouth_region = source_frame[sy:sy+sh, sx:sx+sw]
             
@@ -102,32 +142,28 @@ class LipSyncProcessor:
                 
                 # Create result
                 result = target_frame.copy()
-                
-                # Blend mouth region
-                mouth_mask = mask[ty:ty+th, tx:tx+tw]
-                mouth_mask_3channel = cv2.cvtColor(mouth_mask, cv2.COLOR_GRAY2BGR) / 255.0
-                
+
                 # Seamless cloning for better blending
                 center = (tx + tw // 2, ty + th // 2)
-                
+
                 # Normal blend first
-                result[ty:ty+th, tx:tx+tw] = (
-                    result[ty:ty+th, tx:tx+tw] * (1 - mouth_mask_3channel) +
-                    resized_mouth * mouth_mask_3channel
-                ).astype(np.uint8)
-                
-                # Try seamless clone if available
-                try:
-                    result = cv2.seamlessClone(
-                        resized_mouth,
-                        result,
-                        mouth_mask,
-                        center,
-                        cv2.NORMAL_CLONE
-                    )
-                except:
-                    pass  # Fallback to normal blend if seamless clone fails
+                cv2.copyTo(resized_mouth, mouth_mask, result[ty:ty+th, tx:tx+tw])
                 
+                # Refine with seamless clone on keyframes only - the
+                # Poisson solve is too slow to run at full frame rate
+                self._frame_idx += 1
+                if self._frame_idx % self._seamless_every == 0:
+                    try:
+                        result = cv2.seamlessClone(
+                            resized_mouth,
+                            result,
+                            mouth_mask,
+                            center,
+                            cv2.NORMAL_CLONE
+                        )
+                    except:
+                        pass  # Fallback to normal blend if seamless clone fails
+
                 return result
             
         except Exception as e:
@@ -135,23 +171,40 @@ class LipSyncProcessor:
         
         return target_frame
     
-    def process_frame(self, source_frame: np.ndarray, swapped_frame: np.ndarray) -> np.ndarray:
+    def process_frame(self, source_frame: np.ndarray, swapped_frame: np.ndarray,
+                      source_gray: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Process frame with lip sync.
-        
+
         Args:
             source_frame: Original camera frame
             swapped_frame: Frame with swapped face
-            
+            source_gray: Optional grayscale version of source_frame, if the
+                caller already converted it
+
         Returns:
             Frame with lip sync applied
         """
         if not self.enabled:
             return swapped_frame
-        
-        # Get mouth landmarks
-        source_mouth = self.get_mouth_landmarks(source_frame)
-        target_mouth = self.get_mouth_landmarks(swapped_frame)
-        
+
+        if source_gray is None:
+            source_gray = self._to_gray(source_frame)
+
+        # Run the expensive HOG face detector once, on the source frame
+        # only - the face position is essentially unchanged after the
+        # swap paste-back, so the same rectangle works for both frames
+        faces = self.detector(source_gray)
+        if len(faces) == 0:
+            return swapped_frame
+        face_rect = faces[0]
+
+        source_shape = self.predictor(source_gray, face_rect)
+        source_mouth = self._extract_mouth_points(source_shape, self._source_mouth_buf)
+
+        swapped_gray = cv2.cvtColor(swapped_frame, cv2.COLOR_BGR2GRAY)
+        target_shape = self.predictor(swapped_gray, face_rect)
+        target_mouth = self._extract_mouth_points(target_shape, self._target_mouth_buf)
+
         # Transfer mouth
         return self.transfer_mouth(source_frame, swapped_frame, source_mouth, target_mouth) 
\ No newline at end of file
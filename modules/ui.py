@@ -11,6 +11,13 @@ from PIL import Image, ImageTk
 import numpy as np
 import threading
 
+# Try to use libjpeg-turbo for source image decoding
+try:
+    from turbojpeg import TurboJPEG
+    _turbo_jpeg = TurboJPEG()
+except Exception:
+    _turbo_jpeg = None
+
 # Set appearance
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
@@ -32,6 +39,26 @@ class DeepfakeApp:
         self.source_image_path = None
         self.is_live = False
         self.preview_label = None
+
+        # Persistent preview photo, updated in place each frame
+        self._tk_photo = None
+
+        # Pending after() id of the FPS tick, so stopping live mode can
+        # cancel it instead of leaving it to fire later
+        self._fps_after_id = None
+
+        # Persistent source thumbnail image, reconfigured on selection
+        self._source_photo = None
+
+        # Latest-frame slot for marshalling preview frames from the
+        # camera thread onto the Tk main thread; older frames are dropped
+        self._latest_frame = None
+        self._latest_frame_lock = threading.Lock()
+        self._render_pending = False
+
+        # Reusable resize buffer for the preview path, allocated on
+        # first frame and only replaced on size changes
+        self._preview_buf = None
         
         # Setup UI
         self._setup_ui()
@@ -210,21 +237,50 @@ Features:
         
         if file_path:
             self.source_image_path = file_path
-            
+
             # Update preview
             try:
-                # Load and resize image for preview
-                image = Image.open(file_path)
-                image.thumbnail((200, 200), Image.Resampling.LANCZOS)
-                photo = ctk.CTkImage(light_image=image, dark_image=image, size=(200, 200))
-                self.source_preview.configure(image=photo, text="")
-                
-                # Set source face
-                if self.camera_processor.set_source_image(file_path):
+                # Decode once and share the pixels between the thumbnail
+                # and face detection - previously PIL decoded here and the
+                # face swapper ran a second full cv2.imread of the same
+                # file. JPEGs go through libjpeg-turbo when available
+                bgr = None
+                if _turbo_jpeg is not None and file_path.lower().endswith(('.jpg', '.jpeg')):
+                    try:
+                        with open(file_path, 'rb') as f:
+                            bgr = _turbo_jpeg.decode(f.read())
+                    except Exception:
+                        bgr = None
+                if bgr is None:
+                    bgr = cv2.imread(file_path)
+                if bgr is None:
+                    raise ValueError("Unsupported or corrupt image file")
+
+                # Build the 200px thumbnail from the decoded pixels
+                height, width = bgr.shape[:2]
+                scale = min(200 / width, 200 / height, 1.0)
+                thumb = cv2.resize(
+                    bgr,
+                    (max(1, int(width * scale)), max(1, int(height * scale))),
+                    interpolation=cv2.INTER_AREA
+                )
+                image = Image.fromarray(cv2.cvtColor(thumb, cv2.COLOR_BGR2RGB))
+                # Reuse one CTkImage and swap its pixels rather than
+                # building a new Tcl photo on every selection
+                if self._source_photo is None:
+                    self._source_photo = ctk.CTkImage(
+                        light_image=image, dark_image=image, size=(200, 200)
+                    )
+                    self.source_preview.configure(image=self._source_photo, text="")
+                else:
+                    self._source_photo.configure(light_image=image, dark_image=image)
+
+                # Set source face from the already-decoded image
+                if self.camera_processor.set_source_image_ndarray(bgr):
                     messagebox.showinfo("Success", "Source face loaded successfully!")
                 else:
                     messagebox.showerror("Error", "Failed to detect face in image")
-                    
+
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load image: {str(e)}")
     
@@ -243,18 +299,24 @@ Features:
                 self.is_live = True
                 self.live_btn.configure(text="Stop Live")
                 
-                # Start FPS update thread
-                self.fps_thread = threading.Thread(target=self._update_fps, daemon=True)
-                self.fps_thread.start()
+                # Start periodic FPS updates on the Tk event loop
+                self._fps_after_id = self.root.after(500, self._update_fps_tick)
             else:
                 messagebox.showerror("Error", "Failed to start camera")
         else:
             # Stop camera
             self.camera_processor.stop()
             self.is_live = False
+            # Cancel the pending FPS tick: a restart within its 500 ms
+            # window would otherwise find is_live true again and leave
+            # two chains rescheduling themselves forever
+            if self._fps_after_id is not None:
+                self.root.after_cancel(self._fps_after_id)
+                self._fps_after_id = None
             self.live_btn.configure(text="Start Live")
+            self._tk_photo = None
             self.preview_label.configure(
-                image=None, 
+                image=None,
                 text="Camera preview will appear here\n\nClick 'Start Live' to begin"
             )
     
@@ -270,42 +332,93 @@ Features:
         self.lip_sync_btn.configure(text=f"Lip Sync: {'ON' if enabled else 'OFF'}")
     
     def _update_preview(self, frame):
-        """Update preview with processed frame."""
+        """
+        Receive a processed frame from the camera thread.
+
+        Tk widgets must only be touched from the main thread, so this
+        just stores the newest frame and schedules _render_latest on the
+        Tk event loop; if a render is already pending the frame simply
+        replaces the older one.
+        """
         if not self.is_live:
             return
-        
+
+        with self._latest_frame_lock:
+            self._latest_frame = frame
+            if self._render_pending:
+                return
+            self._render_pending = True
+
+        try:
+            self.root.after_idle(self._render_latest)
+        except Exception:
+            pass  # Main loop is shutting down
+
+    def _render_latest(self):
+        """Render the most recent frame on the Tk main thread."""
+        with self._latest_frame_lock:
+            frame = self._latest_frame
+            self._latest_frame = None
+            self._render_pending = False
+
+        if frame is None or not self.is_live:
+            return
+
         try:
-            # Convert frame to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
             # Resize for display
-            height, width = frame_rgb.shape[:2]
+            height, width = frame.shape[:2]
             max_width = 800
             max_height = 600
-            
+
+            # Frames arrive from CameraProcessor already in RGB, so this
+            # path only has to scale into the preview-owned buffer
             if width > max_width or height > max_height:
                 scale = min(max_width / width, max_height / height)
                 new_width = int(width * scale)
                 new_height = int(height * scale)
-                frame_rgb = cv2.resize(frame_rgb, (new_width, new_height))
-            
-            # Convert to PIL Image
-            image = Image.fromarray(frame_rgb)
-            photo = ImageTk.PhotoImage(image=image)
+                if (self._preview_buf is None
+                        or self._preview_buf.shape[:2] != (new_height, new_width)):
+                    self._preview_buf = np.empty((new_height, new_width, 3), dtype=np.uint8)
+                # INTER_AREA is the fast, good-looking downscale choice
+                frame_rgb = cv2.resize(frame, (new_width, new_height),
+                                       dst=self._preview_buf, interpolation=cv2.INTER_AREA)
+            else:
+                # Copy into our own buffer so the camera thread is free
+                # to reuse its output buffer while we paste
+                if self._preview_buf is None or self._preview_buf.shape != frame.shape:
+                    self._preview_buf = np.empty_like(frame)
+                np.copyto(self._preview_buf, frame)
+                frame_rgb = self._preview_buf
             
-            # Update label
-            self.preview_label.configure(image=photo, text="")
-            self.preview_label.image = photo  # Keep reference
+            # Wrap the preview buffer without copying: frombuffer with
+            # the 'raw' decoder shares the numpy memory, where fromarray
+            # would copy the whole frame again. The buffer is dedicated
+            # to the preview and contiguous, so sharing is safe
+            buf_h, buf_w = frame_rgb.shape[:2]
+            image = Image.frombuffer('RGB', (buf_w, buf_h), frame_rgb, 'raw', 'RGB', 0, 1)
+
+            # Reuse one PhotoImage and paste into it: paste() blits the
+            # pixels through Tk_PhotoPutBlock directly, instead of
+            # building and uploading a brand new Tcl photo every frame
+            if (self._tk_photo is None
+                    or self._tk_photo.width() != image.width
+                    or self._tk_photo.height() != image.height):
+                self._tk_photo = ImageTk.PhotoImage(image=image)
+                self.preview_label.configure(image=self._tk_photo, text="")
+            else:
+                self._tk_photo.paste(image)
             
         except Exception as e:
             print(f"Error updating preview: {e}")
     
-    def _update_fps(self):
-        """Update FPS display."""
-        while self.is_live:
-            fps = self.camera_processor.get_fps()
-            self.fps_label.configure(text=f"FPS: {fps:.1f}")
-            threading.Event().wait(0.5)
+    def _update_fps_tick(self):
+        """Update FPS display, rescheduling itself while live."""
+        if not self.is_live:
+            self._fps_after_id = None
+            return
+        fps = self.camera_processor.get_fps()
+        self.fps_label.configure(text=f"FPS: {fps:.1f}")
+        self._fps_after_id = self.root.after(500, self._update_fps_tick)
     
     def run(self):
         """Run the application."""
@@ -4,11 +4,26 @@ Utility functions for Deepfake Live Camera.
 
 import os
 import sys
+import json
 import platform
+import hashlib
 import subprocess
-import urllib.request
+import importlib.util
+import concurrent.futures
 from pathlib import Path
-import gdown
+import requests
+
+# Cached result of a successful requirements check, keyed by interpreter
+ENV_CACHE_PATH = Path.home() / ".cache" / "deepfake-live" / "env.json"
+
+# SHA-256 of the published inswapper_128.onnx (554 MB)
+SWAPPER_MODEL_SHA256 = "e4a3f08c753cb72d04e10aa0f7dbe3deebbf39567d4ead6dce08e98aa49e16af"
+
+# Download sources for the face swapper model, tried in order
+SWAPPER_MODEL_URLS = [
+    "https://huggingface.co/deepinsight/inswapper/resolve/main/inswapper_128.onnx",
+    "https://github.com/facefusion/facefusion-assets/releases/download/models/inswapper_128.onnx",
+]
 
 def check_requirements() -> bool:
     """
@@ -18,6 +33,18 @@ def check_requirements() -> bool:
         True if all requirements are met
     """
     try:
+        # Trust a previous successful check for this exact interpreter -
+        # installed packages rarely change between launches, and a stale
+        # cache only costs one clear import error later
+        try:
+            cached = json.loads(ENV_CACHE_PATH.read_text())
+            if (cached.get("ok")
+                    and cached.get("py") == sys.version
+                    and cached.get("prefix") == sys.prefix):
+                return True
+        except Exception:
+            pass
+
         # Check Python version
         if sys.version_info[:2] != (3, 10):
             print(f"Error: Python 3.10 is required, but you're using Python {sys.version}")
@@ -32,38 +59,96 @@ def check_requirements() -> bool:
         if platform.machine() not in ["arm64", "aarch64"]:
             print("Warning: This application is optimized for Apple Silicon (M1/M2/M3)")
         
-        # Check required packages
-        required_packages = [
-            "cv2",
-            "numpy",
-            "insightface",
-            "onnxruntime",
-            "customtkinter",
-            "PIL"
-        ]
-        
+        # Check required packages. cv2 and numpy get a real import since
+        # run.py uses them immediately anyway; the heavy packages are only
+        # checked for presence with find_spec, which resolves the module
+        # without executing its top-level code (onnxruntime/insightface
+        # imports alone cost 1-3s of cold start)
         missing_packages = []
-        for package in required_packages:
+        for package in ["cv2", "numpy"]:
             try:
                 __import__(package)
             except ImportError:
                 missing_packages.append(package)
+        for package in ["insightface", "onnxruntime", "customtkinter", "PIL"]:
+            if importlib.util.find_spec(package) is None:
+                missing_packages.append(package)
         
         if missing_packages:
             print(f"Missing packages: {', '.join(missing_packages)}")
             print("Please install requirements: pip install -r requirements.txt")
             return False
-        
+
+        # Remember the successful check so the next launch can skip it
+        try:
+            ENV_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            ENV_CACHE_PATH.write_text(json.dumps(
+                {"py": sys.version, "prefix": sys.prefix, "ok": True}
+            ))
+        except Exception:
+            pass
+
         return True
         
     except Exception as e:
         print(f"Error checking requirements: {e}")
         return False
 
+def _sha256_of_file(path: Path) -> str:
+    """Compute the SHA-256 of a file in 1 MiB chunks."""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+def _download_with_resume(url: str, destination: Path, expected_sha256: str) -> bool:
+    """
+    Download a file with HTTP range resume and checksum verification.
+
+    A partial file at destination is continued with a Range request
+    instead of restarting from zero. On checksum mismatch the file is
+    removed and the download retried once from scratch.
+
+    Returns:
+        True if the file was downloaded and verified
+    """
+    for attempt in range(2):
+        existing = destination.stat().st_size if destination.exists() else 0
+        headers = {'Range': f'bytes={existing}-'} if existing else {}
+
+        response = requests.get(url, stream=True, timeout=30, headers=headers)
+        if existing and response.status_code not in (206, 200):
+            # The server rejected the range outright - typically 416 when
+            # the partial file is already full length but was never
+            # verified and renamed. Raising here would wedge every later
+            # run on the same Range header, so drop the partial file and
+            # re-request from scratch instead
+            response.close()
+            destination.unlink()
+            existing = 0
+            response = requests.get(url, stream=True, timeout=30)
+        with response:
+            if existing and response.status_code != 206:
+                # Server ignored the range request - start over
+                existing = 0
+            response.raise_for_status()
+            with open(destination, 'ab' if existing else 'wb') as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    if chunk:
+                        f.write(chunk)
+
+        if _sha256_of_file(destination) == expected_sha256:
+            return True
+        print("Checksum mismatch, retrying download...")
+        destination.unlink()
+
+    return False
+
 def download_models() -> bool:
     """
     Download required models if not present.
-    
+
     Returns:
         True if models are available
     """
@@ -71,37 +156,32 @@ def download_models() -> bool:
         # Create models directory
         models_dir = Path("models")
         models_dir.mkdir(exist_ok=True)
-        
+
         # Check for face swapper model
         swapper_model_path = models_dir / "inswapper_128.onnx"
-        
+
         if not swapper_model_path.exists():
             print("Downloading face swapper model...")
-            
-            # Google Drive file ID for inswapper_128.onnx
-            file_id = "1HvZ4MAtzlY74Dk4ASGIS9L6Rg5oZdqvu"
-            url = f"https://drive.google.com/uc?id={file_id}"
-            
-            try:
-                # Use gdown to download from Google Drive
-                gdown.download(url, str(swapper_model_path), quiet=False)
-                print("Face swapper model downloaded successfully")
-            except Exception as e:
-                print(f"Error downloading face swapper model: {e}")
-                
-                # Alternative download method
-                print("Trying alternative download method...")
-                alternative_url = "https://github.com/facefusion/facefusion-assets/releases/download/models/inswapper_128.onnx"
-                
+
+            # Download to a .part file so an interrupted download can be
+            # resumed, and only rename into place once verified
+            partial_path = swapper_model_path.with_suffix(".onnx.part")
+
+            for url in SWAPPER_MODEL_URLS:
                 try:
-                    urllib.request.urlretrieve(alternative_url, str(swapper_model_path))
-                    print("Face swapper model downloaded successfully (alternative method)")
-                except Exception as e2:
-                    print(f"Alternative download also failed: {e2}")
-                    print("\nPlease download the model manually:")
-                    print(f"1. Download inswapper_128.onnx from: {alternative_url}")
-                    print(f"2. Place it in: {swapper_model_path}")
-                    return False
+                    print(f"Trying: {url}")
+                    if _download_with_resume(url, partial_path, SWAPPER_MODEL_SHA256):
+                        partial_path.rename(swapper_model_path)
+                        print("Face swapper model downloaded and verified")
+                        break
+                except Exception as e:
+                    print(f"Error downloading face swapper model: {e}")
+
+            if not swapper_model_path.exists():
+                print("\nPlease download the model manually:")
+                print(f"1. Download inswapper_128.onnx from: {SWAPPER_MODEL_URLS[0]}")
+                print(f"2. Place it in: {swapper_model_path}")
+                return False
         
         # Check for InsightFace models (will be downloaded automatically by InsightFace)
         insightface_dir = Path.home() / ".insightface"
@@ -122,15 +202,28 @@ def get_available_cameras() -> list:
     Returns:
         List of tuples (index, name)
     """
-    cameras = []
-    
-    # Check up to 5 camera indices
-    for i in range(5):
-        cap = cv2.VideoCapture(i)
-        if cap.isOpened():
-            cameras.append((i, f"Camera {i}"))
+    def probe(index):
+        cap = cv2.VideoCapture(index)
+        try:
+            return cap.isOpened()
+        finally:
             cap.release()
-    
+
+    cameras = []
+
+    # Probe up to 5 camera indices concurrently: on macOS a single
+    # AVFoundation probe can take over a second even for a device that
+    # doesn't exist, so serial probing could stall startup for ~5s
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
+    futures = {i: executor.submit(probe, i) for i in range(5)}
+    for i, future in futures.items():
+        try:
+            if future.result(timeout=1.5):
+                cameras.append((i, f"Camera {i}"))
+        except Exception:
+            pass  # Probe timed out or failed - treat as no camera
+    executor.shutdown(wait=False)
+
     return cameras
 
 def optimize_for_macos():
@@ -141,14 +234,33 @@ def optimize_for_macos():
         # Set environment variables for better performance
         os.environ['OPENCV_VIDEOIO_PRIORITY_AVFOUNDATION'] = '1'
         os.environ['QT_MAC_WANTS_LAYER'] = '1'
+
+        # Leave headroom for the Tk main loop: OpenCV and the OpenMP
+        # pools otherwise fan out across every core and preempt the UI
+        # thread whenever inference is running, which shows up as preview
+        # judder. Going from all cores to all-but-two costs little - the
+        # big parallelism win is in the first few cores anyway
+        worker_threads = max(1, (os.cpu_count() or 4) - 2)
+        os.environ.setdefault('OMP_NUM_THREADS', str(worker_threads))
+        try:
+            cv2.setNumThreads(worker_threads)
+        except Exception:
+            pass
         
-        # Disable App Nap for better performance
+        # Disable App Nap for better performance. Read the current value
+        # first so repeat launches don't rewrite the user's preferences
+        # plist when the key is already set
         if platform.system() == "Darwin":
             try:
-                subprocess.run(
-                    ["defaults", "write", "NSGlobalDomain", "NSAppSleepDisabled", "-bool", "YES"],
-                    check=True
+                current = subprocess.run(
+                    ["defaults", "read", "NSGlobalDomain", "NSAppSleepDisabled"],
+                    capture_output=True, text=True
                 )
+                if current.stdout.strip() != "1":
+                    subprocess.run(
+                        ["defaults", "write", "NSGlobalDomain", "NSAppSleepDisabled", "-bool", "YES"],
+                        check=True
+                    )
             except:
                 pass
                 
@@ -1,13 +1,9 @@
 #!/usr/bin/env python3
 import os
 import sys
+import signal
 import argparse
-import cv2
-import numpy as np
-from typing import Optional
 import threading
-import queue
-import time
 
 # Suppress warnings
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
@@ -75,6 +71,11 @@ def main():
     # Initialize face swapper
     print(f"Initializing face swapper with {args.execution_provider} provider...")
     face_swapper = FaceSwapper(execution_provider=args.execution_provider)
+
+    # Pre-warm the inference graphs in the background so the first camera
+    # frame doesn't pay the provider's compilation latency; it overlaps
+    # with the user picking a source image
+    threading.Thread(target=face_swapper.warm_up, daemon=True).start()
     
     # Initialize camera processor
     camera_processor = CameraProcessor(
@@ -96,15 +97,15 @@ def main():
         camera_processor.set_source_image(args.source)
         camera_processor.start()
         
-        print("Press 'q' to quit...")
-        try:
-            while True:
-                time.sleep(0.1)
-                if cv2.waitKey(1) & 0xFF == ord('q'):
-                    break
-        except KeyboardInterrupt:
-            pass
-        
+        # Block until interrupted instead of busy-polling: the old loop
+        # woke 10x/s and called cv2.waitKey, which only works with an
+        # OpenCV window that CLI mode never creates
+        print("Press Ctrl+C to quit...")
+        stop_event = threading.Event()
+        signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+        stop_event.wait()
+
         camera_processor.stop()
     else:
         # GUI mode
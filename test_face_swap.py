@@ -70,12 +70,12 @@ def test_face_swap():
         return False
     
     print("\n3. Checking InsightFace models...")
-    insightface_path = os.path.expanduser("~/.insightface/models")
-    if os.path.exists(insightface_path):
+    insightface_path = Path(os.path.expanduser("~/.insightface/models"))
+    if insightface_path.exists():
         print(f"InsightFace models directory: {insightface_path}")
-        for root, dirs, files in os.walk(insightface_path):
-            for file in files:
-                print(f"  - {os.path.join(root, file)}")
+        # Build one string so the listing is a single write instead of
+        # one syscall per file
+        print("\n".join(f"  - {p}" for p in sorted(insightface_path.rglob("*")) if p.is_file()))
     else:
         print("InsightFace models directory not found.")
     